@@ -10,22 +10,44 @@ Where R(x, y, z) is a Ricci-like curvature field, and alpha & beta
 are coupling parameters. We optionally visualize the z-mid slice in
 real-time, track max amplitude and total energy, and save final plots
 only if the final amplitude changes by more than a given threshold
-relative to the last saved run. Additionally, we capture frames in-memory
-and create an animated GIF for each run, named based on (alpha, beta).
+relative to the last saved run. Additionally, we capture frames and stream
+them into an animated GIF for each run, named based on (alpha, beta).
 """
 
 import os
-import io
+import math
+import argparse
 import time
+import queue
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Tuple, Optional
 
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from tqdm import tqdm
 import imageio  # needed for creating animated GIFs
 
+try:
+    from numba import njit, prange, set_num_threads, cuda, float32, float64
+    HAVE_NUMBA = True
+except ImportError:
+    # Without Numba the PDE step falls back to SciPy's compiled stencils
+    from scipy import ndimage
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# CUDA offload is optional on top of Numba; checked once at import
+HAVE_CUDA = HAVE_NUMBA and cuda.is_available()
+
 # --------------------------------------------------------------------
 # 1) Setup Logging
 # --------------------------------------------------------------------
@@ -59,6 +81,9 @@ class CoupledParams3D:
     - output_dir: folder for results
     - realtime_interval: how often we update the real-time slice
     - enable_realtime_plotting: toggles live plot
+    - save_gif: toggles the per-run animated GIF (independent of the live plot)
+    - use_gpu: runs the PDE step on a CUDA GPU via Numba, if one is available
+    - show_progress: toggles the per-step tqdm progress bar
     - random_init: if True, uses a random initial field instead of sin(x)*sin(y)*sin(z)
     """
 
@@ -81,7 +106,10 @@ class CoupledParams3D:
         output_dir: str = "3d_extended_run",
         realtime_interval: int = 50,
         enable_realtime_plotting: bool = True,
-        random_init: bool = True
+        random_init: bool = True,
+        save_gif: bool = True,
+        use_gpu: bool = False,
+        show_progress: bool = True
     ):
         self.alpha = alpha
         self.beta = beta
@@ -101,6 +129,9 @@ class CoupledParams3D:
         self.realtime_interval = realtime_interval
         self.enable_realtime_plotting = enable_realtime_plotting
         self.random_init = random_init
+        self.save_gif = save_gif
+        self.use_gpu = use_gpu
+        self.show_progress = show_progress
 
 
 # --------------------------------------------------------------------
@@ -110,17 +141,22 @@ def define_ricci_3d(params: CoupledParams3D) -> np.ndarray:
     """
     Generate a Ricci-like curvature field:
       R(x,y,z) = mass / (r^2 + smoothing) * 1e-6
+
+    Returned with a one-voxel zero halo, shape (nx+2, ny+2, nz+2), to match
+    the padded field layout used by the PDE step.
     """
     x_vals = np.linspace(-params.nx/2, params.nx/2, params.nx)
     y_vals = np.linspace(-params.ny/2, params.ny/2, params.ny)
     z_vals = np.linspace(-params.nz/2, params.nz/2, params.nz)
-    X, Y, Z = np.meshgrid(x_vals, y_vals, z_vals, indexing='ij')
 
-    r2 = X**2 + Y**2 + Z**2
+    # Broadcast 1D axes instead of materializing X, Y, Z meshgrids
+    r2 = ((x_vals * x_vals)[:, None, None]
+          + (y_vals * y_vals)[None, :, None]
+          + (z_vals * z_vals)[None, None, :])
     smoothing = 1e3
 
-    R_field = params.mass / (r2 + smoothing)
-    R_field *= 1e-6
+    R_field = np.zeros((params.nx + 2, params.ny + 2, params.nz + 2), dtype=np.float32)
+    R_field[1:-1, 1:-1, 1:-1] = params.mass / (r2 + smoothing) * 1e-6
     return R_field
 
 
@@ -132,7 +168,9 @@ def initialize_field_3d(params: CoupledParams3D) -> Tuple[np.ndarray, np.ndarray
     If random_init=True, use a small random field to break symmetry.
     Otherwise, use sin(x)*sin(y)*sin(z).
 
-    Returns (E, E_prev) for the PDE updates.
+    Returns (E, E_prev) for the PDE updates, in single precision and padded
+    with a one-voxel halo: the field lives in E[1:-1, 1:-1, 1:-1] and the halo
+    is refreshed by fill_halo before every step.
     """
     if params.random_init:
         # For reproducible random patterns each run
@@ -145,8 +183,10 @@ def initialize_field_3d(params: CoupledParams3D) -> Tuple[np.ndarray, np.ndarray
         X, Y, Z = np.meshgrid(x_vals, y_vals, z_vals, indexing='ij')
         E_init = 1e-10 * np.sin(X) * np.sin(Y) * np.sin(Z)
 
-    E_prev = E_init.copy()
-    return E_init, E_prev
+    E_padded = np.zeros((params.nx + 2, params.ny + 2, params.nz + 2), dtype=np.float32)
+    E_padded[1:-1, 1:-1, 1:-1] = E_init
+    E_prev = E_padded.copy()
+    return E_padded, E_prev
 
 
 # --------------------------------------------------------------------
@@ -155,6 +195,9 @@ def initialize_field_3d(params: CoupledParams3D) -> Tuple[np.ndarray, np.ndarray
 def laplacian_3d(E: np.ndarray, dx: float, dy: float, dz: float) -> np.ndarray:
     """
     3D finite-difference Laplacian of E.
+
+    Pure-NumPy reference implementation; the simulation itself uses the
+    fused step from make_pde_step (or pde_step_numpy without Numba).
     """
     d2E = np.zeros_like(E)
 
@@ -169,12 +212,388 @@ def laplacian_3d(E: np.ndarray, dx: float, dy: float, dz: float) -> np.ndarray:
 
 
 # --------------------------------------------------------------------
-# 6) Single PDE Run with Real-Time Plotting + Unique GIF per (alpha,beta)
+# 6) Fused PDE Step (Numba)
+# --------------------------------------------------------------------
+# Symmetric limit applied to |E| after damping, inside the fused step
+CLIP_LIMIT = 1e5
+
+# Tile shape for the stencil sweep; k is innermost (contiguous), so tiles span
+# long k-runs and split the slower x/y axes. Tune for the target cache sizes.
+TILE_I = 8
+TILE_J = 8
+TILE_K = 64
+
+# fastmath without 'nnan'/'ninf', so the in-kernel NaN/Inf test is not folded away
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(nogil=True)
+def fill_halo(E: np.ndarray) -> None:
+    """
+    Refresh the one-voxel halo of a padded field by odd reflection
+    (ghost = 2*face - inner), so each axis' second difference vanishes on
+    the faces as in laplacian_3d and the stencil needs no boundary branches.
+    """
+    E[0, :, :] = E[1, :, :] + E[1, :, :] - E[2, :, :]
+    E[-1, :, :] = E[-2, :, :] + E[-2, :, :] - E[-3, :, :]
+    E[:, 0, :] = E[:, 1, :] + E[:, 1, :] - E[:, 2, :]
+    E[:, -1, :] = E[:, -2, :] + E[:, -2, :] - E[:, -3, :]
+    E[:, :, 0] = E[:, :, 1] + E[:, :, 1] - E[:, :, 2]
+    E[:, :, -1] = E[:, :, -2] + E[:, :, -2] - E[:, :, -3]
+
+
+# Second-difference weights along one axis
+SECOND_DIFF = np.array([1.0, -2.0, 1.0])
+
+# Interior of a padded field
+INTERIOR = (slice(1, -1),) * 3
+
+# Persistent (lapl, d2) scratch buffers for pde_step_numpy, keyed by (shape, dtype)
+_NUMPY_SCRATCH = {}
+
+
+def pde_step_numpy(
+    E: np.ndarray,
+    E_prev: np.ndarray,
+    E_new: np.ndarray,
+    K: np.ndarray,
+    inv_dx2: float,
+    inv_dy2: float,
+    inv_dz2: float,
+    dt2_c2: float,
+    src: float,
+    damping: float,
+    clip_hi: float
+) -> Tuple[float, float, int]:
+    """
+    NumPy/SciPy PDE step used by make_pde_step when Numba is not installed.
+    Same update and return values as the fused kernel.
+
+    Each axis' second difference comes from scipy.ndimage.correlate1d,
+    which runs the stencil in compiled code over the padded field after
+    fill_halo. All arithmetic is done in place into the interior of E_new
+    and two reused scratch buffers (lapl sized to the interior), so no
+    full-size arrays are allocated per step for the update itself or for
+    the max |E| / sum(E^2) tracking. Instead of a full np.isfinite pass,
+    NaN/Inf is detected from the max (nonfinite is then 1, not a count).
+    """
+    key = (E.shape, E.dtype)
+    if key not in _NUMPY_SCRATCH:
+        _NUMPY_SCRATCH[key] = (np.empty_like(E[INTERIOR]), np.empty_like(E))
+    lapl, d2 = _NUMPY_SCRATCH[key]
+
+    fill_halo(E)
+    lapl.fill(0)
+    for axis, inv_h2 in enumerate((inv_dx2, inv_dy2, inv_dz2)):
+        ndimage.correlate1d(E, SECOND_DIFF, axis=axis, output=d2, mode='constant')
+        d2 *= inv_h2
+        lapl += d2[INTERIOR]
+
+    # E_new = damping * (2E - E_prev + dt2_c2*lapl + K*E + src), interior only
+    E_mid = E[INTERIOR]
+    E_out = E_new[INTERIOR]
+    np.multiply(K[INTERIOR], E_mid, out=E_out)
+    E_out += E_mid
+    E_out += E_mid
+    E_out -= E_prev[INTERIOR]
+    lapl *= dt2_c2
+    E_out += lapl
+    E_out += src
+    E_out *= damping
+
+    # Metrics reuse the lapl scratch: |E_new| for the max, then scaled by 1/max
+    # so the BLAS dot cannot underflow float32 on the tiny field values.
+    # The max doubles as the NaN/Inf sentinel (np.max propagates NaN), and
+    # the clamp pass only runs when something actually exceeds clip_hi.
+    np.abs(E_out, out=lapl)
+    max_abs = float(lapl.max())
+    if not math.isfinite(max_abs):
+        return max_abs, math.nan, 1
+    if max_abs > clip_hi:
+        np.clip(E_out, -clip_hi, clip_hi, out=E_out)
+        np.minimum(lapl, clip_hi, out=lapl)
+        max_abs = float(clip_hi)
+
+    sum_sq = 0.0
+    if max_abs > 0.0:
+        lapl *= 1.0 / max_abs
+        flat = lapl.ravel()
+        sum_sq = float(flat.dot(flat)) * max_abs * max_abs
+    return max_abs, sum_sq, 0
+
+
+# Compiled steps, one per (nx, ny, nz, damping, clip_hi)
+_PDE_STEP_CACHE = {}
+
+
+def make_pde_step(
+    nx: int,
+    ny: int,
+    nz: int,
+    damping: float,
+    clip_hi: float,
+    use_gpu: bool = False
+):
+    """
+    Build (or fetch from cache) the PDE step for a fixed grid, damping and
+    clamp limit:
+
+      step(E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src)
+        -> (max |E_new|, sum(E_new^2), nonfinite)
+
+    It writes E_new = clip(damping*(2E - E_prev + dt2_c2*∇²E + K*E + src), ±clip_hi)
+    into the interior of arrays padded to (nx+2, ny+2, nz+2); nonfinite
+    counts NaN/Inf updates before clamping.
+
+    Grid size, damping and clip_hi are baked into the step (compile-time
+    constants under Numba) and cached per key. Without Numba it wraps
+    pde_step_numpy; use_gpu=True returns the CUDA step.
+    """
+    key = (nx, ny, nz, float(damping), float(clip_hi), use_gpu)
+    if key in _PDE_STEP_CACHE:
+        return _PDE_STEP_CACHE[key]
+
+    if use_gpu:
+        step = _make_pde_step_gpu(nx, ny, nz, damping, clip_hi)
+        _PDE_STEP_CACHE[key] = step
+        return step
+
+    if not HAVE_NUMBA:
+        def step(E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src):
+            return pde_step_numpy(
+                E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src,
+                damping, clip_hi
+            )
+        _PDE_STEP_CACHE[key] = step
+        return step
+
+    n_tj = (ny + TILE_J - 1) // TILE_J
+    n_tiles = ((nx + TILE_I - 1) // TILE_I) * n_tj
+
+    @njit(parallel=True, fastmath=FASTMATH_FLAGS, boundscheck=False, nogil=True)
+    def step(E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src):
+        zero = E.dtype.type(0)
+        two = E.dtype.type(2)
+        damp = E.dtype.type(damping)
+        hi = E.dtype.type(clip_hi)
+        max_abs = 0.0
+        sum_sq = 0.0
+        nonfinite = 0
+        fill_halo(E)
+        # (i, j) tiles go to threads; math stays in E's dtype, sum_sq in float64
+        for tile in prange(n_tiles):
+            ii = 1 + (tile // n_tj) * TILE_I
+            jj = 1 + (tile % n_tj) * TILE_J
+            for kk in range(1, nz + 1, TILE_K):
+                for i in range(ii, min(ii + TILE_I, nx + 1)):
+                    for j in range(jj, min(jj + TILE_J, ny + 1)):
+                        for k in range(kk, min(kk + TILE_K, nz + 1)):
+                            center = E[i, j, k]
+                            lapl = ((E[i+1, j, k] - two*center + E[i-1, j, k]) * inv_dx2
+                                    + (E[i, j+1, k] - two*center + E[i, j-1, k]) * inv_dy2
+                                    + (E[i, j, k+1] - two*center + E[i, j, k-1]) * inv_dz2)
+
+                            val = damp * (two*center - E_prev[i, j, k] + dt2_c2 * lapl
+                                          + K[i, j, k] * center + src)
+                            if not (val == val) or val - val != zero:
+                                nonfinite += 1
+                            val = min(max(val, -hi), hi)
+                            E_new[i, j, k] = val
+
+                            max_abs = max(max_abs, abs(val))
+                            wide = np.float64(val)
+                            sum_sq += wide * wide
+
+        return max_abs, sum_sq, nonfinite
+
+    _PDE_STEP_CACHE[key] = step
+    return step
+
+
+# --------------------------------------------------------------------
+# 7) CUDA PDE Step (Numba)
+# --------------------------------------------------------------------
+# Thread-block shape for the CUDA step; k maps to threadIdx.x so warps read
+# contiguous memory
+GPU_BLOCK_I = 8
+GPU_BLOCK_J = 8
+GPU_BLOCK_K = 8
+GPU_BLOCK_SIZE = GPU_BLOCK_I * GPU_BLOCK_J * GPU_BLOCK_K
+
+
+def _make_pde_step_gpu(nx: int, ny: int, nz: int, damping: float, clip_hi: float):
+    """
+    CUDA version of the fused step built by make_pde_step, with the same
+    call signature and return values; E, E_prev, E_new and K must be
+    padded float32 device arrays.
+
+    Each thread block stages its tile of E plus a one-voxel halo in shared
+    memory before applying the 7-point stencil. The device halo is never
+    refreshed; face voxels skip that axis' second difference instead.
+    max |E_new|, sum(E_new^2) and the NaN/Inf count are reduced per block
+    in shared memory and folded into a 3-element device array with one set
+    of atomics per block.
+    """
+    damp = np.float32(damping)
+    hi = np.float32(clip_hi)
+    two = np.float32(2.0)
+
+    @cuda.jit
+    def kernel(E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src, stats):
+        tk = cuda.threadIdx.x
+        tj = cuda.threadIdx.y
+        ti = cuda.threadIdx.z
+        # Interior coordinates; the padded array index is one higher
+        k = cuda.blockIdx.x * GPU_BLOCK_K + tk
+        j = cuda.blockIdx.y * GPU_BLOCK_J + tj
+        i = cuda.blockIdx.z * GPU_BLOCK_I + ti
+        inside = i < nx and j < ny and k < nz
+        pi, pj, pk = i + 1, j + 1, k + 1
+
+        tile = cuda.shared.array(
+            (GPU_BLOCK_I + 2, GPU_BLOCK_J + 2, GPU_BLOCK_K + 2), float32
+        )
+        block_max = cuda.shared.array(GPU_BLOCK_SIZE, float64)
+        block_sum = cuda.shared.array(GPU_BLOCK_SIZE, float64)
+        block_bad = cuda.shared.array(GPU_BLOCK_SIZE, float64)
+
+        # Stage E and the halo lanes that neighbouring blocks own; padding
+        # makes every neighbour load in-bounds
+        si, sj, sk = ti + 1, tj + 1, tk + 1
+        if inside:
+            tile[si, sj, sk] = E[pi, pj, pk]
+            if ti == 0:
+                tile[0, sj, sk] = E[pi-1, pj, pk]
+            if ti == GPU_BLOCK_I - 1:
+                tile[si+1, sj, sk] = E[pi+1, pj, pk]
+            if tj == 0:
+                tile[si, 0, sk] = E[pi, pj-1, pk]
+            if tj == GPU_BLOCK_J - 1:
+                tile[si, sj+1, sk] = E[pi, pj+1, pk]
+            if tk == 0:
+                tile[si, sj, 0] = E[pi, pj, pk-1]
+            if tk == GPU_BLOCK_K - 1:
+                tile[si, sj, sk+1] = E[pi, pj, pk+1]
+        cuda.syncthreads()
+
+        abs_val = 0.0
+        sq_val = 0.0
+        bad = 0.0
+        if inside:
+            center = tile[si, sj, sk]
+            lapl = float32(0.0)
+            if 0 < i < nx - 1:
+                lapl += (tile[si+1, sj, sk] - two*center + tile[si-1, sj, sk]) * inv_dx2
+            if 0 < j < ny - 1:
+                lapl += (tile[si, sj+1, sk] - two*center + tile[si, sj-1, sk]) * inv_dy2
+            if 0 < k < nz - 1:
+                lapl += (tile[si, sj, sk+1] - two*center + tile[si, sj, sk-1]) * inv_dz2
+
+            val = damp * (two*center - E_prev[pi, pj, pk] + dt2_c2 * lapl
+                          + K[pi, pj, pk] * center + src)
+            if not (val == val) or val - val != float32(0.0):
+                bad = 1.0
+            val = min(max(val, -hi), hi)
+            E_new[pi, pj, pk] = val
+
+            abs_val = abs(val)
+            sq_val = float64(val) * float64(val)
+
+        # Block-level tree reduction, then one atomic per statistic
+        tid = (ti * GPU_BLOCK_J + tj) * GPU_BLOCK_K + tk
+        block_max[tid] = abs_val
+        block_sum[tid] = sq_val
+        block_bad[tid] = bad
+        cuda.syncthreads()
+        stride = GPU_BLOCK_SIZE // 2
+        while stride > 0:
+            if tid < stride:
+                block_max[tid] = max(block_max[tid], block_max[tid + stride])
+                block_sum[tid] += block_sum[tid + stride]
+                block_bad[tid] += block_bad[tid + stride]
+            cuda.syncthreads()
+            stride //= 2
+        if tid == 0:
+            cuda.atomic.max(stats, 0, block_max[0])
+            cuda.atomic.add(stats, 1, block_sum[0])
+            cuda.atomic.add(stats, 2, block_bad[0])
+
+    blocks = (
+        (nz + GPU_BLOCK_K - 1) // GPU_BLOCK_K,
+        (ny + GPU_BLOCK_J - 1) // GPU_BLOCK_J,
+        (nx + GPU_BLOCK_I - 1) // GPU_BLOCK_I,
+    )
+    threads = (GPU_BLOCK_K, GPU_BLOCK_J, GPU_BLOCK_I)
+    stats = cuda.device_array(3, dtype=np.float64)
+    stats_reset = np.zeros(3, dtype=np.float64)
+
+    def step(E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src):
+        stats.copy_to_device(stats_reset)
+        kernel[blocks, threads](
+            E, E_prev, E_new, K, inv_dx2, inv_dy2, inv_dz2, dt2_c2, src, stats
+        )
+        max_abs, sum_sq, nonfinite = stats.copy_to_host()
+        return max_abs, sum_sq, int(nonfinite)
+
+    return step
+
+
+# --------------------------------------------------------------------
+# 8) Background GIF Frame Capture
+# --------------------------------------------------------------------
+def _gif_frame_worker(
+    frame_queue: "queue.Queue[Optional[np.ndarray]]",
+    gif_path: str,
+    first_slice: np.ndarray
+) -> None:
+    """
+    Consume |E| slices from frame_queue until a None sentinel arrives,
+    rendering each onto an off-screen Agg figure and streaming its RGB pixels
+    into the GIF at gif_path, so frames never pile up in memory. Runs on its
+    own thread so rendering overlaps the PDE loop; it never touches pyplot,
+    which must stay on the main thread.
+    """
+    fig = Figure(figsize=(5, 4), dpi=48)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    heatmap = ax.imshow(first_slice, origin='lower', cmap='inferno')
+    cbar = fig.colorbar(heatmap, ax=ax)
+    cbar.set_label("Field |E|")
+    ax.set_title("Real-Time Heatmap (z_mid slice)")
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+
+    # Opened on the first frame; the legacy GIF-PIL writer encodes each frame as
+    # it is appended instead of buffering the whole animation until close()
+    writer = None
+    while True:
+        slice_data = frame_queue.get()
+        if slice_data is None:
+            break
+        heatmap.set_data(slice_data)
+        heatmap.set_clim(slice_data.min(), slice_data.max())
+
+        # Read pixels straight from the canvas instead of a PNG round-trip;
+        # copy because Agg reuses the buffer on the next draw
+        canvas.draw()
+        if writer is None:
+            writer = imageio.get_writer(gif_path, format='GIF-PIL', mode='I', fps=5)
+        writer.append_data(np.asarray(canvas.buffer_rgba())[:, :, :3].copy())
+
+    if writer is not None:
+        writer.close()
+        logging.info(f"   -> Animated GIF saved to {gif_path}")
+
+
+# --------------------------------------------------------------------
+# 9) Single PDE Run with Real-Time Plotting + Unique GIF per (alpha,beta)
 # --------------------------------------------------------------------
 def run_single_sim_realtime(
     params: CoupledParams3D,
     alpha_val: float,
-    beta_val: float
+    beta_val: float,
+    R_field: Optional[np.ndarray] = None,
+    E_init: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Runs the 3D PDE for 'time_steps'. Tracks:
@@ -182,113 +601,278 @@ def run_single_sim_realtime(
       - energy_over_time[t] = 0.5 * sum(E^2) at step t
 
     If enable_realtime_plotting=True, updates a slice every 'realtime_interval' steps.
-    We capture each plotted frame by saving the figure to an in-memory PNG, then reading
-    it into a frames list for an animated GIF. The GIF is named uniquely with alpha_val, beta_val.
+    If save_gif=True, the same slices are handed to a background thread that renders
+    them and streams them into an animated GIF. The GIF is named uniquely with
+    alpha_val, beta_val.
+
+    R_field and E_init depend only on the grid, mass and init mode, so a sweep can
+    build them once and pass them in (padded, as returned by define_ricci_3d and
+    initialize_field_3d); when omitted they are computed here. The returned E and
+    R_field are the unpadded (nx, ny, nz) interiors.
     """
     os.makedirs(params.output_dir, exist_ok=True)
 
+    # Scalars are cast to float32 so the kernel arithmetic stays single precision
     dt2 = (params.dt)**2
     c2 = (params.c)**2
-    alpha_c2 = params.alpha * c2
+    dt2_c2 = np.float32(dt2 * c2)
+    inv_dx2 = np.float32(1.0 / (params.dx**2))
+    inv_dy2 = np.float32(1.0 / (params.dy**2))
+    inv_dz2 = np.float32(1.0 / (params.dz**2))
+
+    # Build curvature and fields; E_new is a persistent buffer rotated each step.
+    # The step only writes the interior, so its halo must start out finite.
+    if R_field is None:
+        R_field = define_ricci_3d(params)
+    if E_init is None:
+        E, E_prev = initialize_field_3d(params)
+    else:
+        E, E_prev = E_init.copy(), E_init.copy()
+    # The compiled step does no bounds checking, so catch unpadded inputs here
+    padded_shape = (params.nx + 2, params.ny + 2, params.nz + 2)
+    for name, arr in (("R_field", R_field), ("E_init", E)):
+        if arr.shape != padded_shape:
+            raise ValueError(
+                f"{name} must be padded to {padded_shape}, got shape {arr.shape}"
+            )
+    E_new = np.zeros_like(E)
 
-    # Build curvature and fields
-    R_field = define_ricci_3d(params)
-    E, E_prev = initialize_field_3d(params)
+    use_gpu = params.use_gpu and HAVE_CUDA
+    if params.use_gpu and not use_gpu:
+        logging.warning("CUDA GPU not available, running the PDE step on the CPU.")
+    pde_step = make_pde_step(
+        params.nx, params.ny, params.nz, params.damping, CLIP_LIMIT, use_gpu=use_gpu
+    )
+
+    # Constant per run: coupling term and source amplitude, with c²dt² folded in
+    K = np.float32(-params.alpha * c2 * dt2) * R_field
+    src_scale = c2 * dt2 * params.beta
+
+    # cos(ω·dt·t) via cos(θ(t+1)) = 2·cos(ω·dt)·cos(θt) - cos(θ(t-1)), no libm call per step
+    cos_step = math.cos(params.omega * params.dt)
+    cos_prev = cos_step  # cos(-ω·dt)
+    cos_curr = 1.0       # cos(0)
 
     max_amplitudes = np.zeros(params.time_steps, dtype=np.float64)
     energy_over_time = np.zeros(params.time_steps, dtype=np.float64)
 
-    # This list will store each frame for the animated GIF
-    frames = []
+    # Padded index of the z-mid plane; slices below also drop the x/y halo
+    z_mid = params.nz // 2 + 1
 
     # Real-time plotting setup
     if params.enable_realtime_plotting:
         plt.ion()
         fig, ax = plt.subplots(figsize=(5, 4))
-        z_mid = params.nz // 2
-        slice_data = np.abs(E[:, :, z_mid])
+        slice_data = np.abs(E[1:-1, 1:-1, z_mid])
         heatmap = ax.imshow(slice_data, origin='lower', cmap='inferno')
         cbar = plt.colorbar(heatmap, ax=ax)
         cbar.set_label("Field |E|")
         ax.set_title("Real-Time Heatmap (z_mid slice)")
         ax.set_xlabel("X")
         ax.set_ylabel("Y")
+        plt.show(block=False)
     else:
         fig = None
         heatmap = None
-        z_mid = params.nz // 2
+
+    # GIF capture runs on a worker thread fed through a queue; the file is
+    # named uniquely based on (alpha_val, beta_val)
+    if params.save_gif:
+        gif_name = f"simulation_a{alpha_val:.1e}_b{beta_val:.1e}.gif"
+        gif_path = os.path.join(params.output_dir, gif_name)
+        frame_queue = queue.Queue()
+        gif_thread = threading.Thread(
+            target=_gif_frame_worker,
+            args=(frame_queue, gif_path, np.abs(E[1:-1, 1:-1, z_mid])),
+            daemon=True
+        )
+        gif_thread.start()
+
+    # On the GPU the field buffers live in device memory for the whole run
+    if use_gpu:
+        E, E_prev, E_new, K = (cuda.to_device(arr) for arr in (E, E_prev, E_new, K))
 
     # PDE iteration
-    pbar = tqdm(range(params.time_steps), desc="Sim PDE", ncols=100)
+    pbar = tqdm(
+        range(params.time_steps), desc="Sim PDE", ncols=100,
+        disable=not params.show_progress
+    )
     for t in pbar:
-        # PDE source
-        source_val = params.beta * np.cos(params.omega * params.dt * t)
-        lapl = laplacian_3d(E, params.dx, params.dy, params.dz)
-
-        PDE_term = c2 * lapl - alpha_c2 * (R_field * E) + (c2 * source_val)
-        E_new = 2.0 * E - E_prev + dt2 * PDE_term
-
-        # Damping
-        E_new *= params.damping
-        # Clamp extremes
-        E_new = np.clip(E_new, -1e5, 1e5)
+        # Laplacian, coupling, source, damping, clamp and metrics in one fused pass
+        max_abs, sum_sq, nonfinite = pde_step(
+            E, E_prev, E_new, K,
+            inv_dx2, inv_dy2, inv_dz2,
+            dt2_c2, np.float32(src_scale * cos_curr)
+        )
+        cos_prev, cos_curr = cos_curr, 2.0 * cos_step * cos_curr - cos_prev
 
         # Check for stability
-        if not np.isfinite(E_new).all():
+        if nonfinite != 0:
             logging.warning(f"NaN/Inf detected at iteration {t}, stopping.")
             pbar.close()
             break
 
-        E_prev = E
-        E = E_new
+        E_prev, E, E_new = E, E_new, E_prev
 
         # Track metrics
-        max_amplitudes[t] = np.max(np.abs(E))
-        energy_over_time[t] = 0.5 * np.sum(E**2)
-
-        # Update real-time slice occasionally
-        if params.enable_realtime_plotting and (t % params.realtime_interval == 0):
-            slice_data = np.abs(E[:, :, z_mid])
-            heatmap.set_data(slice_data)
-            heatmap.set_clim(slice_data.min(), slice_data.max())
-            plt.draw()
-            plt.pause(0.001)
-
-            # -------------------------------------------------
-            # Capture the frame for GIF using an in-memory PNG
-            # -------------------------------------------------
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=72)
-            buf.seek(0)
-            frame = imageio.imread(buf)
-            frames.append(frame)
-            buf.close()
+        max_amplitudes[t] = max_abs
+        energy_over_time[t] = 0.5 * sum_sq
+
+        # Update real-time slice / GIF frame occasionally
+        if t % params.realtime_interval == 0:
+            E_host = E.copy_to_host() if use_gpu else E
+            slice_data = np.abs(E_host[1:-1, 1:-1, z_mid])
+            if params.save_gif:
+                frame_queue.put(slice_data)
+            if params.enable_realtime_plotting:
+                heatmap.set_data(slice_data)
+                # set_clim forces a full recolor, so only rescale when the
+                # range moved by more than 5% of the current span
+                lo, hi = slice_data.min(), slice_data.max()
+                cur_lo, cur_hi = heatmap.get_clim()
+                tol = 0.05 * max(cur_hi - cur_lo, 1e-30)
+                if abs(lo - cur_lo) > tol or abs(hi - cur_hi) > tol:
+                    heatmap.set_clim(lo, hi)
+                # Service the GUI without plt.pause's mandatory sleep
+                fig.canvas.draw_idle()
+                fig.canvas.flush_events()
 
     pbar.close()
 
-    # Create a unique GIF filename based on (alpha_val, beta_val)
-    if params.enable_realtime_plotting and len(frames) > 1:
-        gif_name = f"simulation_a{alpha_val:.1e}_b{beta_val:.1e}.gif"
-        gif_path = os.path.join(params.output_dir, gif_name)
-        imageio.mimsave(gif_path, frames, fps=5)
-        logging.info(f"   -> Animated GIF saved to {gif_path}")
+    if use_gpu:
+        E = E.copy_to_host()
+
+    if params.save_gif:
+        frame_queue.put(None)
+        gif_thread.join()
 
     # Close real-time figure
     if params.enable_realtime_plotting and fig is not None:
         plt.ioff()
         plt.close(fig)
 
-    return E, max_amplitudes, energy_over_time, R_field
+    return E[INTERIOR], max_amplitudes, energy_over_time, R_field[INTERIOR]
 
 
 # --------------------------------------------------------------------
-# 7) Parameter Sweep with Thresholded Saves
+# 10) Parameter Sweep with Thresholded Saves
 # --------------------------------------------------------------------
+def _init_sweep_worker(numba_threads: int) -> None:
+    """
+    Process-pool initializer: cap Numba's thread pool so concurrent sweep
+    workers do not oversubscribe the CPU.
+    """
+    if HAVE_NUMBA:
+        set_num_threads(numba_threads)
+
+
+def _run_one(
+    alpha_: float,
+    beta_: float,
+    base_params_dict: dict,
+    R_field: Optional[np.ndarray] = None,
+    E_init: Optional[np.ndarray] = None
+) -> Tuple[float, float, float, Optional[float],
+           Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Run one (alpha, beta) sweep entry. Top-level so it can be pickled into a
+    worker process. R_field / E_init are the sweep-wide shared fields.
+
+    Returns:
+        (alpha, beta, final_maxE, last_amp, plot_payload), where plot_payload
+        is (z_slice, y_slice, max_amps, energy_arr) for the final plots.
+    """
+    # Build fresh params for this run
+    sim_params = CoupledParams3D(**dict(base_params_dict, alpha=alpha_, beta=beta_))
+
+    start_time = time.time()
+    # Pass alpha_, beta_ so run_single_sim_realtime can name the GIF
+    final_E, max_amps, energy_arr, _ = run_single_sim_realtime(
+        sim_params, alpha_val=alpha_, beta_val=beta_, R_field=R_field, E_init=E_init
+    )
+    end_time = time.time()
+    logging.info(
+        f"   PDE run (alpha={alpha_:.2e}, beta={beta_:.2e}) "
+        f"took {end_time - start_time:.2f} s."
+    )
+
+    final_maxE = float(np.max(np.abs(final_E)))
+    last_amp = max_amps[-1] if len(max_amps) else None
+
+    # Slicing
+    z_slice = np.abs(final_E[:, :, sim_params.nz // 2])
+    y_slice = np.abs(final_E[:, sim_params.ny // 2, :])
+
+    return alpha_, beta_, final_maxE, last_amp, (z_slice, y_slice, max_amps, energy_arr)
+
+
+def _save_final_plots(
+    alpha_: float,
+    beta_: float,
+    params: CoupledParams3D,
+    plot_payload: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+) -> None:
+    """
+    Save the final z-mid / y-mid slices and the Max|E| & Energy history
+    for one sweep entry.
+    """
+    z_slice, y_slice, max_amps, energy_arr = plot_payload
+    desc = f"(alpha={alpha_:.2e}, beta={beta_:.2e})"
+    z_mid = params.nz // 2
+    y_mid = params.ny // 2
+
+    # 1) Final z-mid slice
+    figz, axz = plt.subplots(figsize=(5, 4))
+    axz.set_title(f"Final |E| (z={z_mid}) {desc}")
+    imz = axz.imshow(z_slice, origin='lower', cmap='inferno')
+    plt.colorbar(imz, ax=axz, label="|E|")
+    outz = os.path.join(
+        params.output_dir, f"finalZ_a{alpha_:.1e}_b{beta_:.1e}.png"
+    )
+    plt.savefig(outz, dpi=120)
+    plt.close(figz)
+
+    # 2) Final y-mid slice
+    figy, axy = plt.subplots(figsize=(5, 4))
+    axy.set_title(f"Final |E| (y={y_mid}) {desc}")
+    imy = axy.imshow(y_slice.T, origin='lower', cmap='inferno')
+    plt.colorbar(imy, ax=axy, label="|E|")
+    outy = os.path.join(
+        params.output_dir, f"finalY_a{alpha_:.1e}_b{beta_:.1e}.png"
+    )
+    plt.savefig(outy, dpi=120)
+    plt.close(figy)
+
+    # 3) Max|E| & Energy vs Time
+    figm, axm = plt.subplots(figsize=(5, 3.5))
+    axm.plot(max_amps, color='blue', label='Max |E|')
+    axm.set_xlabel("Time Step")
+    axm.set_ylabel("Max |E|", color='blue')
+    axm.tick_params(axis='y', labelcolor='blue')
+
+    axm2 = axm.twinx()
+    axm2.plot(energy_arr, color='red', label='Energy')
+    axm2.set_ylabel("Total Energy (0.5 * ΣE^2)", color='red')
+    axm2.tick_params(axis='y', labelcolor='red')
+
+    axm.set_title(f"Max|E| vs Time {desc}")
+    lines1, labels1 = axm.get_legend_handles_labels()
+    lines2, labels2 = axm2.get_legend_handles_labels()
+    axm.legend(lines1 + lines2, labels1 + labels2, loc="best")
+
+    outm = os.path.join(
+        params.output_dir, f"maxAmpEnergy_a{alpha_:.1e}_b{beta_:.1e}.png"
+    )
+    plt.savefig(outm, dpi=120)
+    plt.close(figm)
+
+
 def param_sweep_3d(
     alpha_list: List[float],
     beta_list: List[float],
     base_params: CoupledParams3D,
-    save_threshold: float = 0.01
+    save_threshold: float = 0.01,
+    max_workers: Optional[int] = None
 ) -> List[Tuple[float, float, float, Optional[float]]]:
     """
     Sweep over alpha & beta. For each combo:
@@ -296,132 +880,113 @@ def param_sweep_3d(
       - only save final plots if final amplitude changes > 'save_threshold'
         vs. the last saved run
 
+    Runs are independent, so they are farmed out to 'max_workers' processes
+    (default: one per CPU) with real-time plotting disabled. max_workers=1
+    runs everything in-process, which keeps the live heatmap available.
+    The save decisions are always made in sweep order. The curvature field and
+    initial field are identical for every entry, so they are built only once.
+
     Returns:
         summary: list of (alpha, beta, final_maxE, last_amp)
     """
     os.makedirs(base_params.output_dir, exist_ok=True)
 
-    summary = []
-    total_runs = len(alpha_list) * len(beta_list)
-    run_count = 0
-    last_saved_amp = None
-
-    for alpha_ in alpha_list:
-        for beta_ in beta_list:
-            run_count += 1
-            desc = f"(alpha={alpha_:.2e}, beta={beta_:.2e})"
-            logging.info(f"--- [Run {run_count}/{total_runs}] PDE 3D {desc} ---")
-
-            # Build fresh params for this run
-            sim_params = CoupledParams3D(
-                alpha=alpha_,
-                beta=beta_,
-                c=base_params.c,
-                omega=base_params.omega,
-                nx=base_params.nx, ny=base_params.ny, nz=base_params.nz,
-                dx=base_params.dx, dy=base_params.dy, dz=base_params.dz,
-                dt=base_params.dt, time_steps=base_params.time_steps,
-                mass=base_params.mass,
-                damping=base_params.damping,
-                output_dir=base_params.output_dir,
-                realtime_interval=base_params.realtime_interval,
-                enable_realtime_plotting=base_params.enable_realtime_plotting,
-                random_init=base_params.random_init
+    combos = [(a, b) for a in alpha_list for b in beta_list]
+    total_runs = len(combos)
+    base_params_dict = dict(vars(base_params))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, total_runs))
+
+    # Neither depends on alpha/beta (and the random init is seeded)
+    R_field = define_ricci_3d(base_params)
+    E_init, _ = initialize_field_3d(base_params)
+
+    results = [None] * total_runs
+    if max_workers == 1:
+        for idx, (alpha_, beta_) in enumerate(combos):
+            logging.info(
+                f"--- [Run {idx + 1}/{total_runs}] PDE 3D "
+                f"(alpha={alpha_:.2e}, beta={beta_:.2e}) ---"
             )
-
-            start_time = time.time()
-            # Pass alpha_, beta_ so run_single_sim_realtime can name the GIF
-            final_E, max_amps, energy_arr, _ = run_single_sim_realtime(
-                sim_params, alpha_val=alpha_, beta_val=beta_
+            results[idx] = _run_one(alpha_, beta_, base_params_dict, R_field, E_init)
+    else:
+        # matplotlib is not fork-safe and live plots would only slow workers down
+        if base_params.enable_realtime_plotting:
+            logging.warning(
+                "Real-time plotting is disabled for parallel sweeps; "
+                "pass max_workers=1 to keep the live heatmap."
             )
-            end_time = time.time()
-            logging.info(f"   PDE run took {end_time - start_time:.2f} s.")
-
-            final_maxE = np.max(np.abs(final_E))
-            last_amp = max_amps[-1] if len(max_amps) else None
-
-            # Decide if we should save final plots
-            should_save = False
-            if last_saved_amp is None:
-                should_save = True
-            else:
-                rel_diff = abs(final_maxE - last_saved_amp) / max(last_saved_amp, 1e-30)
-                if rel_diff > save_threshold:
-                    should_save = True
-
-            if should_save:
+        base_params_dict["enable_realtime_plotting"] = False
+        # Per-worker bars would interleave on stderr; progress is logged per run instead
+        base_params_dict["show_progress"] = False
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+        numba_threads = max(1, (os.cpu_count() or 1) // max_workers)
+        logging.info(
+            f"Running {total_runs} PDE runs on {max_workers} worker processes "
+            f"({numba_threads} Numba thread(s) each)."
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_sweep_worker,
+            initargs=(numba_threads,)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _run_one, alpha_, beta_, base_params_dict, R_field, E_init
+                ): idx
+                for idx, (alpha_, beta_) in enumerate(combos)
+            }
+            for run_count, future in enumerate(as_completed(futures), start=1):
+                idx = futures[future]
+                alpha_, beta_ = combos[idx]
+                results[idx] = future.result()
                 logging.info(
-                    f"   -> Saving results (amplitude changed > {100*save_threshold:.1f}%)"
+                    f"--- [Run {run_count}/{total_runs}] finished PDE 3D "
+                    f"(alpha={alpha_:.2e}, beta={beta_:.2e}) ---"
                 )
 
-                # Slicing
-                z_mid = sim_params.nz // 2
-                y_mid = sim_params.ny // 2
-                z_slice = np.abs(final_E[:, :, z_mid])
-                y_slice = np.abs(final_E[:, y_mid, :])
-
-                # 1) Final z-mid slice
-                figz, axz = plt.subplots(figsize=(5, 4))
-                axz.set_title(f"Final |E| (z={z_mid}) {desc}")
-                imz = axz.imshow(z_slice, origin='lower', cmap='inferno')
-                plt.colorbar(imz, ax=axz, label="|E|")
-                outz = os.path.join(
-                    sim_params.output_dir, f"finalZ_a{alpha_:.1e}_b{beta_:.1e}.png"
-                )
-                plt.savefig(outz, dpi=120)
-                plt.close(figz)
-
-                # 2) Final y-mid slice
-                figy, axy = plt.subplots(figsize=(5, 4))
-                axy.set_title(f"Final |E| (y={y_mid}) {desc}")
-                imy = axy.imshow(y_slice.T, origin='lower', cmap='inferno')
-                plt.colorbar(imy, ax=axy, label="|E|")
-                outy = os.path.join(
-                    sim_params.output_dir, f"finalY_a{alpha_:.1e}_b{beta_:.1e}.png"
-                )
-                plt.savefig(outy, dpi=120)
-                plt.close(figy)
-
-                # 3) Max|E| & Energy vs Time
-                figm, axm = plt.subplots(figsize=(5, 3.5))
-                axm.plot(max_amps, color='blue', label='Max |E|')
-                axm.set_xlabel("Time Step")
-                axm.set_ylabel("Max |E|", color='blue')
-                axm.tick_params(axis='y', labelcolor='blue')
-
-                axm2 = axm.twinx()
-                axm2.plot(energy_arr, color='red', label='Energy')
-                axm2.set_ylabel("Total Energy (0.5 * ΣE^2)", color='red')
-                axm2.tick_params(axis='y', labelcolor='red')
-
-                axm.set_title(f"Max|E| vs Time {desc}")
-                lines1, labels1 = axm.get_legend_handles_labels()
-                lines2, labels2 = axm2.get_legend_handles_labels()
-                axm.legend(lines1 + lines2, labels1 + labels2, loc="best")
-
-                outm = os.path.join(
-                    sim_params.output_dir, f"maxAmpEnergy_a{alpha_:.1e}_b{beta_:.1e}.png"
-                )
-                plt.savefig(outm, dpi=120)
-                plt.close(figm)
+    summary = []
+    last_saved_amp = None
+    for alpha_, beta_, final_maxE, last_amp, plot_payload in results:
+
+        # Decide if we should save final plots
+        should_save = False
+        if last_saved_amp is None:
+            should_save = True
+        else:
+            rel_diff = abs(final_maxE - last_saved_amp) / max(last_saved_amp, 1e-30)
+            if rel_diff > save_threshold:
+                should_save = True
 
-                last_saved_amp = final_maxE
-            else:
-                logging.info("   -> Skipping save (no significant amplitude change).")
+        if should_save:
+            logging.info(
+                f"   -> (alpha={alpha_:.2e}, beta={beta_:.2e}) Saving results "
+                f"(amplitude changed > {100*save_threshold:.1f}%)"
+            )
+            _save_final_plots(alpha_, beta_, base_params, plot_payload)
+            last_saved_amp = final_maxE
+        else:
+            logging.info(
+                f"   -> (alpha={alpha_:.2e}, beta={beta_:.2e}) "
+                "Skipping save (no significant amplitude change)."
+            )
 
-            summary.append((alpha_, beta_, final_maxE, last_amp))
+        summary.append((alpha_, beta_, final_maxE, last_amp))
 
     return summary
 
 
 # --------------------------------------------------------------------
-# 8) Main: Extended Run + Param Sweep
+# 11) Main: Extended Run + Param Sweep
 # --------------------------------------------------------------------
-def run_3d_extended_realtime_sweep() -> None:
+def run_3d_extended_realtime_sweep(use_gpu: bool = False) -> None:
     """
     Main function to run a parameter sweep over alpha,beta and 
     do real-time PDE simulations, saving final results if amplitude changes enough.
     Each run saves a unique GIF named based on (alpha, beta).
+    With use_gpu=True the PDE step runs on a CUDA GPU and runs execute one at a time.
     """
     base_params = CoupledParams3D(
         alpha=1e-6,
@@ -437,20 +1002,28 @@ def run_3d_extended_realtime_sweep() -> None:
         output_dir="3d_extended_run",
         realtime_interval=50,
         enable_realtime_plotting=True,
-        random_init=True
+        random_init=True,
+        use_gpu=use_gpu
     )
 
     alpha_list = [1e-6, 2e-6, 3e-6, 4e-6]
     beta_list  = [1e-7, 2e-7, 3e-7, 4e-7, 5e-7, 6e-7, 7e-7, 8e-7, 9e-7, 1e-6]
 
-    logging.info("\n--- Starting Extended 3D PDE Sweep with Real-Time Heatmap ---")
+    # A single GPU is shared by all runs, so don't fan out across processes;
+    # only the in-process sweep can show the live heatmap
+    max_workers = 1 if use_gpu else None
+    mode = "with Real-Time Heatmap" if max_workers == 1 else "on a process pool"
+    logging.info(f"\n--- Starting Extended 3D PDE Sweep {mode} ---")
     logging.info(f"Domain: {base_params.nx}×{base_params.ny}×{base_params.nz}, "
                  f"steps={base_params.time_steps}, dt={base_params.dt}")
     logging.info(f"alpha_list={alpha_list}")
     logging.info(f"beta_list={beta_list}\n")
 
     global_start = time.time()
-    results = param_sweep_3d(alpha_list, beta_list, base_params, save_threshold=0.01)
+    results = param_sweep_3d(
+        alpha_list, beta_list, base_params, save_threshold=0.01,
+        max_workers=max_workers
+    )
     global_end = time.time()
 
     # Print a summary
@@ -466,7 +1039,13 @@ def run_3d_extended_realtime_sweep() -> None:
 
 
 # --------------------------------------------------------------------
-# 9) Entry Point
+# 12) Entry Point
 # --------------------------------------------------------------------
 if __name__ == "__main__":
-    run_3d_extended_realtime_sweep()
+    parser = argparse.ArgumentParser(description="3D coupled PDE parameter sweep")
+    parser.add_argument(
+        "--gpu", action="store_true",
+        help="run the PDE step on a CUDA GPU (requires Numba with CUDA support)"
+    )
+    args = parser.parse_args()
+    run_3d_extended_realtime_sweep(use_gpu=args.gpu)